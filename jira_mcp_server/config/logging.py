@@ -6,9 +6,85 @@ formatter and a handler that directs logs either to a file or
 to stderr.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+_last_config: Optional[tuple[str, Optional[str]]] = None
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes instead of flushing every record.
+
+    Records are written to a buffered stream which is flushed when a record
+    of ``flush_level`` or above is emitted, when the buffer fills up, and by a
+    background thread every ``flush_interval`` seconds, so records are written
+    out even when no new record arrives.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 30.0,
+        flush_level: int = logging.ERROR,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        super().__init__(filename)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._stop_flushing.set()
+        super().close()
+
+
+def _stop_listener() -> None:
+    """Drain queued records, stop the background logging thread and close its handlers."""
+    global _listener
+
+    if _listener:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging() -> None:
@@ -20,16 +96,28 @@ def setup_logging() -> None:
       Defaults to 'INFO'.
     - ``LOG_FILE``: The name of the file for logging (e.g., 'app.log').
       If provided, the file will be created inside a ``logs/`` directory.
+      Records are handed to a background thread through a queue so that
+      writing to disk never blocks the caller.
       If not provided, logs are directed to ``sys.stderr``.
+
+    Calling it again with an unchanged configuration is a no-op, so the
+    log file is not reopened and handlers are not rebuilt.
     """
+    global _listener, _last_config
+
     log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
     log_file = os.environ.get("LOG_FILE", None)
 
     logger = logging.getLogger()
 
+    config = (log_level, log_file)
+    if config == _last_config and logger.handlers:
+        return
+
     # Clear existing handlers to prevent duplicate log entries
     if logger.hasHandlers():
         logger.handlers.clear()
+    _stop_listener()
 
     logger.setLevel(log_level)
 
@@ -44,9 +132,17 @@ def setup_logging() -> None:
         os.makedirs(log_dir, exist_ok=True)
         # Create the full path for the log file
         log_path = os.path.join(log_dir, log_file)
-        handler = logging.FileHandler(log_path)
+        file_handler = BufferedFileHandler(log_path)
+        file_handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(-1)
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+
+        handler = QueueHandler(log_queue)
     else:
         handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(formatter)
 
-    handler.setFormatter(formatter)
     logger.addHandler(handler)
+    _last_config = config
@@ -0,0 +1,86 @@
+"""Jira API tools exposed by the MCP server."""
+
+from .cache import (
+    clear_caches,
+)
+from .general import (
+    get_projects,
+    get_priorities,
+    get_labels,
+    get_current_user,
+    get_issue_statuses,
+    get_bootstrap_metadata,
+)
+from .project import (
+    get_project_users,
+    get_project_issues,
+    get_project_issue_types,
+)
+from .issue import (
+    get_issue_creation_metadata,
+    get_issue_creation_bundle,
+    create_issue,
+    bulk_create_issues,
+    get_issue,
+    bulk_edit_issues,
+    update_issue,
+    change_issue_title,
+    change_issue_description,
+    change_issue_reporter,
+    change_issue_priority,
+    change_issue_environment,
+    change_issue_parent,
+    add_issue_labels,
+    change_issue_labels,
+    remove_issue_labels,
+    update_issue_labels,
+    update_issue_duedate,
+    get_issue_link_types,
+    link_issues,
+    delete_issues_link,
+    delete_issue,
+    assign_issue,
+    comment_issue,
+    get_available_transitions,
+    transition_issue,
+)
+
+# Every tool registered on the MCP server, in the order they are listed to clients.
+TOOLS = (
+    get_projects,
+    get_priorities,
+    get_labels,
+    get_current_user,
+    get_issue_statuses,
+    get_bootstrap_metadata,
+    clear_caches,
+    get_project_users,
+    get_project_issues,
+    get_project_issue_types,
+    get_issue_creation_metadata,
+    get_issue_creation_bundle,
+    create_issue,
+    bulk_create_issues,
+    get_issue,
+    bulk_edit_issues,
+    update_issue,
+    change_issue_title,
+    change_issue_description,
+    change_issue_reporter,
+    change_issue_priority,
+    change_issue_environment,
+    change_issue_parent,
+    add_issue_labels,
+    change_issue_labels,
+    remove_issue_labels,
+    update_issue_labels,
+    update_issue_duedate,
+    get_issue_link_types,
+    link_issues,
+    delete_issues_link,
+    delete_issue,
+    assign_issue,
+    comment_issue,
+    get_available_transitions,
+    transition_issue,
+)
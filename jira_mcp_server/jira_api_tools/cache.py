@@ -0,0 +1,191 @@
+"""In-process caching for Jira API data that rarely changes."""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# How long metadata such as priorities or issue link types is reused before being fetched again.
+METADATA_CACHE_TTL = int(os.getenv("JIRA_METADATA_CACHE_TTL", "3600"))
+# How long the users of a project are reused before being fetched again.
+USERS_CACHE_TTL = int(os.getenv("JIRA_USERS_CACHE_TTL", "1800"))
+# How many results per project or issue type a cached function keeps before dropping the oldest.
+CACHE_MAXSIZE = int(os.getenv("JIRA_CACHE_MAXSIZE", "128"))
+
+# Every function decorated with ttl_cache, so that all their caches can be dropped at once.
+_CACHED_FUNCTIONS: list[Callable] = []
+
+_MISSING = object()
+
+
+class DiskCache:
+    """SQLite store keeping JSON-serializable results across server restarts.
+
+    Entries are stored with their wall-clock creation time and the name of the
+    function that produced them, so that a function's entries can be dropped
+    together. Storage errors are logged and treated as cache misses.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        try:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, func TEXT, stored_at REAL, value TEXT)"
+            )
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def get(self, key: str, seconds: float) -> tuple[float, object]:
+        """
+        Return the age and value stored under ``key`` if it is younger than ``seconds``,
+        otherwise ``(0, _MISSING)``.
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT stored_at, value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None or time.time() - row[0] >= seconds:
+                return 0, _MISSING
+            return time.time() - row[0], json.loads(row[1])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Could not read from the disk cache: %s", e)
+            return 0, _MISSING
+
+    def set(self, key: str, func: str, value: object) -> None:
+        """Store ``value`` under ``key``, replacing any previous entry."""
+        try:
+            data = json.dumps(value)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, func, stored_at, value) VALUES (?, ?, ?, ?)",
+                    (key, func, time.time(), data),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("Could not write to the disk cache: %s", e)
+
+    def clear(self, func: str) -> None:
+        """Drop every entry stored by ``func``."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache WHERE func = ?", (func,))
+        except sqlite3.Error as e:
+            logger.warning("Could not clear the disk cache: %s", e)
+
+
+def _open_disk_cache() -> Optional[DiskCache]:
+    """
+    Open the disk cache if it is enabled. If it cannot be opened (e.g. unwritable path, locked or
+    corrupt file), a warning is logged and the server runs with the in-memory caches only.
+    """
+    if os.getenv("JIRA_DISK_CACHE") != "1":
+        return None
+    path = os.getenv("JIRA_DISK_CACHE_PATH", ".jira_cache.sqlite3")
+    try:
+        return DiskCache(path)
+    except sqlite3.Error as e:
+        logger.warning("Could not open the disk cache at %s, it is disabled: %s", path, e)
+        return None
+
+
+# Opt-in with JIRA_DISK_CACHE=1: results of functions cached with persistent=True are also
+# kept on disk, so a restarted server does not need to fetch them again.
+DISK_CACHE: Optional[DiskCache] = _open_disk_cache()
+
+
+def _disk_key(name: str, key: tuple) -> str:
+    """
+    Build the disk cache key of a call. It includes the Jira instance and user, as the
+    cache file outlives the configuration of the server.
+    """
+    raw = f"{os.getenv('JIRA_BASE_URL')}|{os.getenv('JIRA_USER')}|{name}|{key!r}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def ttl_cache(seconds: float, persistent: bool = False, maxsize: Optional[int] = None) -> Callable:
+    """
+    Decorator caching the results of a function for a number of seconds, keyed by its arguments.
+    The key is built from the bound arguments with defaults applied, so positional, keyword and
+    explicit-default calls with the same values share one entry.
+    Failed Jira responses (dictionaries with ``"successful": False``) are never cached.
+    The decorated function gets a ``cache_clear()`` method dropping all its cached results.
+
+    :param seconds: Time to live of the cached results.
+    :param persistent: Also keep the results in the disk cache when it is enabled. Only for
+                       functions returning JSON-serializable data.
+    :param maxsize: Maximum number of results kept in memory. When it is reached, the oldest
+                    result is dropped. Unbounded by default.
+
+    :return: The decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: dict[tuple, tuple[float, object]] = {}
+        lock = threading.Lock()
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+        disk = DISK_CACHE if persistent else None
+
+        def store(key: tuple, stored_at: float, result: object) -> None:
+            with lock:
+                cache.pop(key, None)
+                if maxsize is not None and len(cache) >= maxsize:
+                    del cache[next(iter(cache))]
+                cache[key] = (stored_at, result)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and now - entry[0] < seconds:
+                logger.debug("Cache hit for %s%s", func.__name__, key)
+                return entry[1]
+
+            if disk is not None:
+                age, result = disk.get(_disk_key(name, key), seconds)
+                if result is not _MISSING:
+                    logger.debug("Disk cache hit for %s%s", func.__name__, key)
+                    store(key, now - age, result)
+                    return result
+
+            result = func(*args, **kwargs)
+            if not (isinstance(result, dict) and result.get("successful") is False):
+                store(key, now, result)
+                if disk is not None:
+                    disk.set(_disk_key(name, key), name, result)
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+            if disk is not None:
+                disk.clear(name)
+
+        wrapper.cache_clear = cache_clear
+        _CACHED_FUNCTIONS.append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def clear_caches() -> dict:
+    """
+    Drop all cached Jira data (priorities, issue link types, issue types, users...) so that
+    it is fetched again from Jira. Use it when data was changed in Jira in the meantime.
+
+    :return: A dictionary with the names of the functions whose cache was cleared.
+    """
+    logger.info("Clearing all caches")
+    for func in _CACHED_FUNCTIONS:
+        func.cache_clear()
+    return {"cleared": [func.__name__ for func in _CACHED_FUNCTIONS]}
@@ -1,21 +1,348 @@
 """General utility functions for interacting with the Jira API."""
 
+import base64
+import copy
 import logging
+import math
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from http import HTTPMethod
-from urllib.parse import urljoin
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .cache import METADATA_CACHE_TTL, clear_caches, ttl_cache
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up, installed with the "speedups" extra
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional speed-up, installed with the "speedups" extra
+    ijson = None
+
+_ITEMS_DECODE_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
 
-JIRA_AUTH = HTTPBasicAuth(str(os.getenv("JIRA_USER")), str(os.getenv("JIRA_API_KEY")))
 logger = logging.getLogger(__name__)
 
+# Configuration is read once from the environment instead of on every request.
+# Call reload_config() if the environment changes at runtime.
+# The base URL always ends with "/" so that endpoints can be appended by plain concatenation.
+_JIRA_BASE_URL = str(os.getenv("JIRA_BASE_URL")).rstrip("/") + "/"
+# Maximum number of bytes of a failed response body kept in the returned error text
+_ERROR_TEXT_LIMIT = 4096
+_JIRA_USER = str(os.getenv("JIRA_USER"))
+_JIRA_API_KEY = str(os.getenv("JIRA_API_KEY"))
+
+
+def _request_timeout() -> tuple[float, float]:
+    """
+    Read the request timeouts from the environment. Connecting to Jira should be quick, so it
+    gets its own short timeout (``JIRA_CONNECT_TIMEOUT``) and an unreachable host fails fast,
+    while reading a response uses ``JIRA_READ_TIMEOUT``, or ``REQUESTS_TIMEOUT`` if unset.
+
+    :return: The ``(connect, read)`` timeouts in seconds, as accepted by requests.
+    """
+    return (
+        float(os.getenv("JIRA_CONNECT_TIMEOUT", "3")),
+        float(os.getenv("JIRA_READ_TIMEOUT", os.getenv("REQUESTS_TIMEOUT", "30"))),
+    )
+
+
+_REQUESTS_TIMEOUT = _request_timeout()
+
+
+def _basic_auth_header(user: str, api_key: str) -> str:
+    """
+    Build the value of the ``Authorization`` header for HTTP basic authentication.
+    It is computed once and set on the session instead of being re-encoded on every request.
+
+    :param user: The Jira user.
+    :param api_key: The Jira API key of the user.
+
+    :return: The header value, e.g. ``Basic dXNlcjprZXk=``.
+    """
+    return "Basic " + base64.b64encode(f"{user}:{api_key}".encode()).decode()
+
+
+_AUTH_HEADER = _basic_auth_header(_JIRA_USER, _JIRA_API_KEY)
+
+# Full URLs of the static endpoints, joined once instead of on every request.
+_STATIC_ENDPOINTS = ("project", "priority", "label", "status", "myself")
+_ENDPOINTS = {path: _JIRA_BASE_URL + path for path in _STATIC_ENDPOINTS}
+
+
+class _JiraRetry(Retry):
+    """Retry policy that additionally retries POST requests rejected by Jira's rate limiter.
+
+    POST is not idempotent (e.g. a retried create_issue could create a duplicate issue)
+    after a 5xx, but a 429 response means the request was not processed at all.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST" and status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Transient failures (429 and 5xx) are retried on the pooled keep-alive connection,
+# honouring the Retry-After header sent by Jira when rate limiting, so they never reach
+# the caller as errors. Other 4xx responses are returned immediately.
+# Once retries are exhausted the last response is returned instead of raising.
+# The number of retries is read from JIRA_MAX_RETRIES when building the session.
+_RETRY = _JiraRetry(
+    backoff_factor=0.25,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET", "PUT", "DELETE"),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+def _build_session() -> requests.Session:
+    """
+    Build the HTTP session shared by every tool call, so that TCP/TLS connections
+    to the Jira host are kept alive and reused instead of renegotiated per request.
+    ``JIRA_POOL_MAXSIZE`` bounds how many connections can be open concurrently and
+    ``JIRA_MAX_RETRIES`` how many times a transient failure is retried.
+
+    :return: A configured ``requests.Session``.
+    """
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json", "Authorization": _AUTH_HEADER})
+    # requests looks up proxies, CA bundles and .netrc in the environment on every request,
+    # and a .netrc entry would even replace the Authorization header. Opt in when a proxy is needed.
+    session.trust_env = os.getenv("JIRA_USE_ENV_PROXY") == "1"
+    adapter = HTTPAdapter(
+        pool_connections=int(os.getenv("JIRA_POOL_CONNECTIONS", "10")),
+        pool_maxsize=int(os.getenv("JIRA_POOL_MAXSIZE", "20")),
+        max_retries=_RETRY.new(total=int(os.getenv("JIRA_MAX_RETRIES", "5"))),
+    )
+    # Self-hosted Jira instances may be served over plain HTTP
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+# Bounds the number of requests sent to Jira at the same time, whatever the number of
+# concurrent tool calls and fan-outs, to stay below Jira's rate limits. Requests waiting
+# for a Retry-After delay keep their slot, which slows down the others too.
+_REQUEST_SLOTS = threading.BoundedSemaphore(int(os.getenv("JIRA_MAX_CONCURRENT", "10")))
+
+# GET requests currently being sent, see _single_flight()
+_INFLIGHT: dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+# Bumped whenever a non-GET request completes. It is part of the single-flight key, so a GET
+# started after a write never joins a GET that may have been sent before it.
+_WRITE_GENERATION = 0
+
+# Last decoded body of GET responses carrying an ETag or Last-Modified header, keyed like
+# _INFLIGHT, so the next identical request can be made conditional. Least recently used
+# entries are evicted beyond _VALIDATED_MAXSIZE.
+_VALIDATED: OrderedDict[tuple, tuple[Optional[str], Optional[str], object]] = OrderedDict()
+_VALIDATED_LOCK = threading.Lock()
+_VALIDATED_MAXSIZE = 128
+
+
+def reload_config() -> None:
+    """
+    Re-read the Jira configuration from the environment and rebuild the shared session.
+    """
+    global _JIRA_BASE_URL, _REQUESTS_TIMEOUT, _JIRA_USER, _JIRA_API_KEY, _AUTH_HEADER, _ENDPOINTS, _SESSION, _REQUEST_SLOTS
+
+    logger.info("Reloading Jira configuration from the environment")
+    _JIRA_BASE_URL = str(os.getenv("JIRA_BASE_URL")).rstrip("/") + "/"
+    _REQUESTS_TIMEOUT = _request_timeout()
+    _JIRA_USER = str(os.getenv("JIRA_USER"))
+    _JIRA_API_KEY = str(os.getenv("JIRA_API_KEY"))
+    _AUTH_HEADER = _basic_auth_header(_JIRA_USER, _JIRA_API_KEY)
+    _ENDPOINTS = {path: _JIRA_BASE_URL + path for path in _STATIC_ENDPOINTS}
+
+    _SESSION.close()
+    _SESSION = _build_session()
+    _REQUEST_SLOTS = threading.BoundedSemaphore(int(os.getenv("JIRA_MAX_CONCURRENT", "10")))
+    # Cached data may belong to another Jira instance or user
+    clear_caches()
+    with _VALIDATED_LOCK:
+        _VALIDATED.clear()
+
+
+def close_session() -> None:
+    """
+    Close the shared HTTP session and release its pooled connections.
+    Intended to be called on server shutdown.
+    """
+    logger.info("Closing Jira HTTP session")
+    _SESSION.close()
+
+
+def _decode_json(response: requests.Response) -> dict | list:
+    """
+    Decode the JSON body of a response.
+    Jira always answers in UTF-8, so orjson (when available) parses the raw bytes directly
+    and skips the encoding detection done by ``response.json()``.
+
+    :param response: The response to decode.
+
+    :return: The JSON-decoded body. Raises ``ValueError`` if it is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _response_summary(response: requests.Response) -> dict:
+    """
+    Summarize a response that could not be returned as JSON.
+    Only the first ``_ERROR_TEXT_LIMIT`` bytes of the body are read and decoded, so large error
+    pages (e.g. HTML from a proxy) are neither downloaded in full when streaming nor copied into
+    a string. Failed requests should log from the summary instead of decoding the body again.
+
+    :param response: The response to summarize.
+
+    :return: A dictionary containing the success flag, status code, response text, reason, and
+             whether the text was truncated.
+    """
+    head = next(response.iter_content(_ERROR_TEXT_LIMIT + 1), b"")
+    return {
+        "successful": response.ok,
+        "status_code": response.status_code,
+        "text": head[:_ERROR_TEXT_LIMIT].decode("utf-8", errors="replace"),
+        "reason": response.reason,
+        "truncated": len(head) > _ERROR_TEXT_LIMIT,
+    }
+
+
+def _single_flight(key: tuple, call: Callable[[], object]) -> object:
+    """
+    Run ``call`` unless a call with the same key is already running in another thread,
+    in which case wait for it and return a deep copy of its result instead, so that callers
+    never share a mutable result.
+
+    :param key: Identifies identical calls.
+    :param call: Zero-argument callable performing the request.
+
+    :return: The result of the call.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[key] = Future()
+
+    if not leader:
+        logger.debug("Joining in-flight request %s", key)
+        return copy.deepcopy(future.result())
+
+    try:
+        result = call()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+    future.set_result(result)
+    return result
+
+
+def _bump_write_generation() -> None:
+    """Make GET requests started from now on ignore those already in flight."""
+    global _WRITE_GENERATION
+    with _INFLIGHT_LOCK:
+        _WRITE_GENERATION += 1
+
+
+def _send_request(
+    method: HTTPMethod,
+    url: str,
+    headers: Optional[Mapping[str, str]],
+    params: Optional[dict],
+    payload: Optional[dict],
+    validation_key: Optional[tuple] = None,
+) -> dict | list:
+    """
+    Send a request to an absolute Jira URL and decode its response, see jira_api_request().
+    With a ``validation_key``, the request is made conditional on the validators of the last
+    response stored under it, and a ``304 Not Modified`` returns that response's body again.
+    """
+    validated = None
+    if validation_key is not None:
+        with _VALIDATED_LOCK:
+            validated = _VALIDATED.get(validation_key)
+    if validated is not None:
+        etag, last_modified, _ = validated
+        headers = {
+            **(headers or {}),
+            **({"If-None-Match": etag} if etag else {}),
+            **({"If-Modified-Since": last_modified} if last_modified else {}),
+        }
+
+    # Serialize the payload with orjson when available, it is much faster than the
+    # stdlib encoder used by requests for the nested ADF documents sent to Jira.
+    data = None
+    if payload is not None and orjson is not None:
+        data = orjson.dumps(payload)
+        headers = {"Content-Type": "application/json", **(headers or {})}
+        payload = None
+
+    with _REQUEST_SLOTS:
+        response = _SESSION.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+            json=payload,
+            timeout=_REQUESTS_TIMEOUT,
+            allow_redirects=False,  # The Jira REST API does not redirect
+        )
+
+    if validated is not None and response.status_code == 304:
+        logger.debug("Resource not modified, reusing the previous response")
+        with _VALIDATED_LOCK:
+            if validation_key in _VALIDATED:
+                _VALIDATED.move_to_end(validation_key)
+        return validated[2]
+
+    if response.ok:
+        logger.debug("Request successful with status code %s", response.status_code)
+        # response.text decodes the whole body, only do it when it is going to be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response text: %s", response.text)
+        try:
+            data = _decode_json(response)
+        except ValueError:  # Raised by both orjson and requests on invalid JSON
+            logger.warning("Failed to decode JSON from response")
+            return _response_summary(response)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if validation_key is not None and (etag or last_modified):
+            with _VALIDATED_LOCK:
+                _VALIDATED[validation_key] = (etag, last_modified, data)
+                _VALIDATED.move_to_end(validation_key)
+                if len(_VALIDATED) > _VALIDATED_MAXSIZE:
+                    _VALIDATED.popitem(last=False)
+        return data
+    else:
+        summary = _response_summary(response)
+        logger.error("Request failed with status code %s: %s - Reason: %s", summary["status_code"], summary["text"], summary["reason"])
+        return summary
+
 
 def jira_api_request(
     method: HTTPMethod,
     endpoint: str,
-    headers: Optional[dict] = None,
+    headers: Optional[Mapping[str, str]] = None,
     params: Optional[dict] = None,
     payload: Optional[dict] = None,
 ) -> dict | list:
@@ -24,53 +351,288 @@ def jira_api_request(
     optional parameters or payload.
 
     :param method: HTTP method to use (e.g., 'GET', 'POST').
-    :param endpoint: API endpoint to call.
-    :param headers: Optional HTTP headers to include in the request.
+    :param endpoint: API endpoint to call, relative to ``JIRA_BASE_URL`` or as an absolute URL.
+    :param headers: Optional HTTP headers to include in the request. They are merged on top
+                    of the session defaults (``Accept: application/json``) and never modified.
     :param params: Query parameters to include in the request.
     :param payload: Data to send in the body of the request.
 
     :return: The JSON-decoded response from the Jira API if the request is successful,
              otherwise a dictionary containing the status code, response text, and reason.
     """
-    logger.info("Requesting %s on %s", method, endpoint)
-    logger.debug("Request details: params=%s, payload=%s, headers=%s", params, payload, headers)
-    endpoint = urljoin(str(os.getenv("JIRA_BASE_URL")), endpoint)
+    logger.debug("Requesting %s on %s", method, endpoint)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Request details: params=%s, payload=%s, headers=%s", params, payload, headers)
+    if not endpoint.startswith(("https://", "http://")):
+        endpoint = _JIRA_BASE_URL + endpoint.lstrip("/")
 
-    headers = headers or {"Accept": "application/json"}
+    if method == HTTPMethod.GET:
+        # Concurrent tool calls often need the same data, e.g. the priorities, so an identical
+        # GET already in flight is joined instead of being sent again.
+        key = (endpoint, repr(params), repr(headers))
+        return _single_flight(
+            (*key, _WRITE_GENERATION),
+            lambda: _send_request(method, endpoint, headers, params, payload, key),
+        )
 
-    response = requests.request(
-        method=method,
-        url=endpoint,
-        headers=headers,
-        params=params,
-        json=payload,
-        auth=JIRA_AUTH,
-        timeout=int(os.getenv("REQUESTS_TIMEOUT")),
-    )
+    try:
+        return _send_request(method, endpoint, headers, params, payload)
+    finally:
+        _bump_write_generation()
 
-    if response.ok:
-        logger.info("Request successful with status code %s", response.status_code)
-        logger.debug("Response text: %s", response.text)
-        try:
-            return response.json()
-        except requests.exceptions.JSONDecodeError:
-            logger.warning("Failed to decode JSON from response")
-            return {
-                "successful": response.ok,
-                "status_code": response.status_code,
-                "text": response.text,
-                "reason": response.reason,
-            }
+
+# Upper bound on the pages fetched by paginate(), in case an endpoint never reports its end
+_MAX_PAGES = 1000
+_NO_ITEM = object()
+
+
+def paginate(
+    endpoint: str,
+    params: Optional[dict] = None,
+    page_size: int = 500,
+    max_results: Optional[int] = None,
+) -> dict | list:
+    """
+    Retrieve every page of a Jira endpoint paginated with ``startAt``/``maxResults`` and return
+    all items. Works with endpoints returning a plain list and with those returning a page object
+    with the items under "values". Fetching large pages takes far fewer round trips than the
+    default page size of 50. If Jira returns fewer items than requested on a page that is not
+    the last one, the page size is lowered to the number of items it actually returned.
+    Paginating stops if a page starts with the same item as the previous one (an endpoint that
+    ignores ``startAt``) and after ``_MAX_PAGES`` pages.
+
+    :param endpoint: API endpoint to call, relative to ``JIRA_BASE_URL`` or as an absolute URL.
+    :param params: Additional query parameters to include in every request.
+    :param page_size: Number of items requested per page.
+    :param max_results: Maximum number of items to return. If None, all items are returned.
+
+    :return: A list with all the items if the requests are successful,
+             otherwise a dictionary containing the status code, response text, and reason.
+    """
+    items = []
+    previous_first = _NO_ITEM
+    for _ in range(_MAX_PAGES):
+        if max_results is not None and len(items) >= max_results:
+            break
+        requested = page_size if max_results is None else min(page_size, max_results - len(items))
+        page = jira_api_request(
+            method=HTTPMethod.GET,
+            endpoint=endpoint,
+            params={**(params or {}), "startAt": len(items), "maxResults": requested},
+        )
+        if isinstance(page, dict) and page.get("successful") is False:
+            return page
+
+        # Plain list endpoints may return short pages (e.g. after permission filtering),
+        # so only an empty page marks their end. Paginated objects tell it with either
+        # 'isLast' or 'total'; without them, keep going until an empty page.
+        values = page if isinstance(page, list) else page.get("values", [])
+        if not values:
+            break
+        if values[0] == previous_first:
+            logger.warning("%s ignores startAt and returned the same page again, stopping", endpoint)
+            break
+        previous_first = values[0]
+        start = len(items)
+        items.extend(values)
+        if isinstance(page, dict):
+            if page.get("isLast"):
+                break
+            if "isLast" not in page and "total" in page and page.get("startAt", start) + len(values) >= page["total"]:
+                break
+
+        if isinstance(page, dict) and len(values) < requested:
+            logger.warning("Jira returned %s items instead of %s, lowering the page size", len(values), requested)
+            page_size = len(values)
     else:
-        logger.error("Request failed with status code %s: %s - Reason: %s", response.status_code, response.text, response.reason)
+        logger.warning("Stopped paginating %s after %s pages", endpoint, _MAX_PAGES)
+
+    return items if max_results is None else items[:max_results]
+
+
+def _walk_items(data: object, path: list[str]):
+    """
+    Yield the values found at an ijson-style prefix inside an already decoded JSON document.
+    Used when ijson is not installed.
+
+    :param data: The decoded JSON document.
+    :param path: The prefix split on dots, e.g. ``["values", "item"]``.
+    """
+    if not path:
+        yield data
+    elif path[0] == "item":
+        for element in data if isinstance(data, list) else ():
+            yield from _walk_items(element, path[1:])
+    elif isinstance(data, dict) and path[0] in data:
+        yield from _walk_items(data[path[0]], path[1:])
+
+
+def _stream_request(method: HTTPMethod, endpoint: str, params: Optional[dict]) -> requests.Response | dict:
+    """
+    Send a request whose body is left unread, to be parsed while it is downloaded.
+
+    :param method: HTTP method to use (e.g., 'GET', 'POST').
+    :param endpoint: API endpoint to call, relative to ``JIRA_BASE_URL`` or as an absolute URL.
+    :param params: Query parameters to include in the request.
+
+    :return: The response if the request is successful, to be closed by the caller,
+             otherwise a dictionary containing the status code, response text, and reason.
+    """
+    if not endpoint.startswith(("https://", "http://")):
+        endpoint = _JIRA_BASE_URL + endpoint.lstrip("/")
+
+    with _REQUEST_SLOTS:
+        response = _SESSION.request(
+            method=method,
+            url=endpoint,
+            params=params,
+            timeout=_REQUESTS_TIMEOUT,
+            allow_redirects=False,  # The Jira REST API does not redirect
+            stream=True,
+        )
+    if not response.ok:
+        with response:
+            summary = _response_summary(response)
+        logger.error("Request failed with status code %s: %s - Reason: %s", summary["status_code"], summary["text"], summary["reason"])
+        return summary
+    return response
+
+
+def _response_items(response: requests.Response, items_path: str) -> Iterator:
+    """
+    Yield the items found at ``items_path`` in the JSON body of a streamed response,
+    closing the response once they are exhausted.
+
+    :param response: A response sent with ``stream=True``.
+    :param items_path: ijson-style prefix of the items, e.g. 'values.item'.
+    """
+    with response:
+        if ijson is not None:
+            # Let urllib3 undo any gzip/deflate encoding while streaming the raw body
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, items_path)
+        else:
+            yield from _walk_items(_decode_json(response), items_path.split("."))
+
+
+def jira_api_request_items(
+    method: HTTPMethod,
+    endpoint: str,
+    items_path: str,
+    params: Optional[dict] = None,
+) -> dict | list:
+    """
+    Make a request to the Jira API and return only the items found at ``items_path`` in
+    the JSON response. With ijson installed the body is parsed incrementally while it is
+    downloaded, so neither the raw body nor the enclosing document are held in memory.
+
+    :param method: HTTP method to use (e.g., 'GET', 'POST').
+    :param endpoint: API endpoint to call, relative to ``JIRA_BASE_URL`` or as an absolute URL.
+    :param items_path: ijson-style prefix of the items to extract, e.g. 'values.item' for the
+                       elements of the 'values' array of a paginated response.
+    :param params: Query parameters to include in the request.
+
+    :return: A list with the extracted items if the request is successful,
+             otherwise a dictionary containing the status code, response text, and reason.
+             As with jira_api_request(), a successful response whose body cannot be decoded
+             is returned as such a dictionary with ``"successful": True``.
+    """
+    logger.debug("Requesting items at '%s' with %s on %s", items_path, method, endpoint)
+    logger.debug("Request details: params=%s", params)
+    response = _stream_request(method, endpoint, params)
+    if isinstance(response, dict):
+        return response
+
+    try:
+        return list(_response_items(response, items_path))
+    except _ITEMS_DECODE_ERRORS:
+        logger.warning("Failed to decode JSON items from response")
         return {
             "successful": response.ok,
             "status_code": response.status_code,
-            "text": response.text,
+            "text": f"Could not decode the items at '{items_path}' from the response.",
             "reason": response.reason,
+            # Part of the body was already consumed by the parser, so it cannot be summarized
+            "truncated": False,
         }
 
 
+def iter_jira_api_items(
+    method: HTTPMethod,
+    endpoint: str,
+    items_path: str,
+    params: Optional[dict] = None,
+) -> Iterator:
+    """
+    Like jira_api_request_items(), but yield the items one at a time as they are parsed, so that
+    only the current item is held in memory. The request is sent on the first iteration and its
+    response is closed as soon as the generator is exhausted or closed, e.g. when the caller
+    stops early. Use it with ``contextlib.closing`` when it may not be fully consumed.
+
+    :param method: HTTP method to use (e.g., 'GET', 'POST').
+    :param endpoint: API endpoint to call, relative to ``JIRA_BASE_URL`` or as an absolute URL.
+    :param items_path: ijson-style prefix of the items to extract, e.g. 'values.item'.
+    :param params: Query parameters to include in the request.
+
+    :return: An iterator over the items. Raises ``requests.HTTPError`` if the request fails,
+             and ``ValueError`` (or ``ijson.JSONError``) if the response cannot be decoded.
+    """
+    logger.debug("Streaming items at '%s' with %s on %s", items_path, method, endpoint)
+    logger.debug("Request details: params=%s", params)
+    response = _stream_request(method, endpoint, params)
+    if isinstance(response, dict):
+        raise requests.HTTPError(
+            f"{response['status_code']} {response['reason']}: {response['text']}"
+        )
+    with response:
+        yield from _response_items(response, items_path)
+
+
+def run_concurrently(calls: dict[str, Callable[[], object]]) -> dict:
+    """
+    Run independent Jira requests concurrently over the shared session and collect their results.
+    Total latency is that of the slowest call instead of the sum of all of them.
+
+    :param calls: Mapping of result name to a zero-argument callable performing the request.
+
+    :return: A dictionary mapping each name to the result of its callable.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(calls), 1)) as executor:
+        futures = {name: executor.submit(call) for name, call in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def map_concurrently(func: Callable[[Any], object], items: Iterable, max_workers: int = 10) -> list:
+    """
+    Apply a function performing Jira requests to every item, running at most ``max_workers``
+    requests at a time over the shared session. Bounding the concurrency avoids hitting
+    Jira's rate limits on large batches.
+
+    :param func: Function called with each item.
+    :param items: The items to process.
+    :param max_workers: Maximum number of concurrent calls.
+
+    :return: A list with the result of each call, in the same order as the items. A call that
+             raised is replaced by a dictionary containing the error, so that the results of
+             the other calls, already applied in Jira, are not lost.
+    """
+    def call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            logger.error("Concurrent call failed for %r: %s", item, e)
+            return {
+                "successful": False,
+                "status_code": None,
+                "text": str(e),
+                "reason": type(e).__name__,
+            }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(call, items))
+
+
+@ttl_cache(seconds=METADATA_CACHE_TTL)
 def get_projects() -> dict | list:
     """
     Get all projects from Jira.
@@ -82,10 +644,11 @@ def get_projects() -> dict | list:
     logger.info("Getting all projects")
     return jira_api_request(
         method=HTTPMethod.GET,
-        endpoint="project",
+        endpoint=_ENDPOINTS["project"],
     )
 
 
+@ttl_cache(seconds=METADATA_CACHE_TTL, persistent=True)
 def get_priorities() -> dict | list:
     """
     Returns the list of all usable issue priorities.
@@ -97,10 +660,36 @@ def get_priorities() -> dict | list:
     logger.info("Getting all priorities")
     return jira_api_request(
         method=HTTPMethod.GET,
-        endpoint="priority",
+        endpoint=_ENDPOINTS["priority"],
     )
 
 
+@ttl_cache(seconds=METADATA_CACHE_TTL)
+def get_priorities_by_id() -> Mapping[str, dict] | dict:
+    """
+    Return all usable issue priorities indexed by their ID, cached for ``JIRA_METADATA_CACHE_TTL``
+    seconds since priorities rarely change.
+
+    :return: A read-only mapping of priority ID to priority (as returned by get_priorities()) if
+             the request is successful, otherwise a dictionary containing the status code,
+             response text, and reason.
+    """
+    priorities = get_priorities()
+    if not isinstance(priorities, list):
+        return priorities
+    return MappingProxyType({priority["id"]: priority for priority in priorities})
+
+
+def invalidate_priorities_cache() -> None:
+    """
+    Drop the cached priorities so the next lookup fetches them again from Jira.
+    """
+    logger.info("Invalidating priorities cache")
+    get_priorities.cache_clear()
+    get_priorities_by_id.cache_clear()
+
+
+@ttl_cache(seconds=METADATA_CACHE_TTL)
 def get_labels(max_results: int = 50) -> dict:
     """
     Retrieve all labels available in Jira.
@@ -116,14 +705,16 @@ def get_labels(max_results: int = 50) -> dict:
 
     return jira_api_request(
         method=HTTPMethod.GET,
-        endpoint="label",
+        endpoint=_ENDPOINTS["label"],
         params=query_params,
     )
 
 
+@ttl_cache(seconds=math.inf)
 def get_current_user() -> dict:
     """
     Retrieve information about the currently authenticated Jira user.
+    The credentials do not change while the server runs, so the user is only fetched once.
     :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-myself/#api-rest-api-3-myself-get
 
     :return: The JSON-decoded response from the Jira API if the request is successful,
@@ -132,5 +723,42 @@ def get_current_user() -> dict:
     logger.info("Getting current user")
     return jira_api_request(
         method=HTTPMethod.GET,
-        endpoint="myself",
+        endpoint=_ENDPOINTS["myself"],
+    )
+
+
+@ttl_cache(seconds=METADATA_CACHE_TTL, persistent=True)
+def get_issue_statuses() -> dict | list:
+    """
+    Retrieve all issue statuses defined in the Jira instance.
+    :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-workflow-statuses/#api-rest-api-3-status-get
+
+    :return: The JSON-decoded response from the Jira API if the request is successful,
+             otherwise a dictionary containing the status code, response text, and reason.
+    """
+    logger.info("Getting all issue statuses")
+    return jira_api_request(
+        method=HTTPMethod.GET,
+        endpoint=_ENDPOINTS["status"],
+    )
+
+
+def get_bootstrap_metadata() -> dict:
+    """
+    Retrieve the projects, priorities, issue statuses, labels and current user in a single call.
+    The underlying requests are sent concurrently, so this is faster than calling each tool in turn.
+
+    :return: A dictionary with the keys 'projects', 'priorities', 'issue_statuses', 'labels' and
+             'current_user', each holding the JSON-decoded response of the corresponding request,
+             or a dictionary containing the status code, response text, and reason if it failed.
+    """
+    logger.info("Getting bootstrap metadata")
+    return run_concurrently(
+        {
+            "projects": get_projects,
+            "priorities": get_priorities,
+            "issue_statuses": get_issue_statuses,
+            "labels": get_labels,
+            "current_user": get_current_user,
+        }
     )
@@ -1,13 +1,55 @@
 """Functions for interacting with Jira issues via the API."""
 
 import logging
+from functools import partial
 from http import HTTPMethod
-from typing import Optional
-from .general import jira_api_request, get_priorities
+from types import MappingProxyType
+from typing import Callable, Optional
+from .cache import CACHE_MAXSIZE, METADATA_CACHE_TTL, ttl_cache
+from .general import (
+    jira_api_request,
+    get_labels,
+    get_priorities,
+    get_priorities_by_id,
+    get_projects,
+    map_concurrently,
+    run_concurrently,
+)
+from .project import get_project_issue_types
 
 logger = logging.getLogger(__name__)
 
+# Shared by every request, read-only so that no call can alter it for the others
+_JSON_HEADERS = MappingProxyType({"Accept": "application/json", "Content-Type": "application/json"})
 
+
+def _adf_text(text: str) -> dict:
+    """
+    Wrap plain text into a single-paragraph Atlassian Document Format (ADF) document,
+    as expected by rich-text fields such as description, environment and comment bodies.
+
+    :param text: The plain text to wrap.
+
+    :return: The ADF document as a dictionary.
+    """
+    return {
+        "content": [
+            {
+                "content": [
+                    {
+                        "text": text,
+                        "type": "text",
+                    }
+                ],
+                "type": "paragraph",
+            }
+        ],
+        "type": "doc",
+        "version": 1,
+    }
+
+
+@ttl_cache(seconds=METADATA_CACHE_TTL, maxsize=CACHE_MAXSIZE)
 def get_issue_creation_metadata(
     project_key: str,
     issue_type_id: str,
@@ -34,6 +76,31 @@ def get_issue_creation_metadata(
     )
 
 
+def get_issue_creation_bundle(project_key: str, issue_type_id: str) -> dict:
+    """
+    Retrieve everything usually needed before creating an issue in a single call: the projects,
+    priorities, labels, the issue types of the project and the creation metadata of the issue type.
+    The underlying requests are sent concurrently, so this is faster than calling each tool in turn.
+
+    :param project_key: Key of the Jira project.
+    :param issue_type_id: ID of the issue type.
+
+    :return: A dictionary with the keys 'projects', 'priorities', 'labels', 'issue_types' and
+             'creation_metadata', each holding the JSON-decoded response of the corresponding
+             request, or a dictionary containing the status code, response text, and reason if it failed.
+    """
+    logger.info("Getting issue creation bundle for project %s and issue type %s", project_key, issue_type_id)
+    return run_concurrently(
+        {
+            "projects": get_projects,
+            "priorities": get_priorities,
+            "labels": get_labels,
+            "issue_types": partial(get_project_issue_types, project_key),
+            "creation_metadata": partial(get_issue_creation_metadata, project_key, issue_type_id),
+        }
+    )
+
+
 def create_issue(
     project_key: str,
     title: str,
@@ -66,62 +133,77 @@ def create_issue(
     logger.info("Creating issue in project %s with title '%s'", project_key, title)
     logger.debug("Issue details: description=%s, issuetype=%s, duedate=%s, assignee_id=%s, labels=%s, priority_id=%s, reporter_id=%s",
                  description, issuetype, duedate, assignee_id, labels, priority_id, reporter_id)
-    payload = {
-        "fields": {
-            "project": {"key": project_key},
-            "summary": title,
-            "issuetype": {"name": issuetype},
-            "description": {
-                "content": [
-                    {
-                        "content": [
-                            {
-                                "text": description,
-                                "type": "text",
-                            }
-                        ],
-                        "type": "paragraph",
-                    }
-                ],
-                "type": "doc",
-                "version": 1,
-            },
-        }
+    fields = {
+        "project": {"key": project_key},
+        "summary": title,
+        "issuetype": {"name": issuetype},
+        "description": _adf_text(description),
+        **({"duedate": duedate} if duedate else {}),
+        **({"assignee": {"id": assignee_id}} if assignee_id else {}),
+        **({"labels": labels} if labels else {}),
+        **({"priority": {"id": priority_id}} if priority_id else {}),
+        **({"reporter": {"id": reporter_id}} if reporter_id else {}),
     }
+    payload = {"fields": fields}
 
-    if duedate:
-        payload["fields"].update({"duedate": duedate})
-    if assignee_id:
-        payload["fields"].update({"assignee": {"id": assignee_id}})
-    if labels:
-        payload["fields"].update({"labels": labels})
-    if priority_id:
-        payload["fields"].update({"priority": {"id": priority_id}})
-    if reporter_id:
-        payload["fields"].update({"reporter": {"id": reporter_id}})
-
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
-
-    return jira_api_request(
+    response = jira_api_request(
         method=HTTPMethod.POST,
         endpoint="issue",
-        headers=headers,
+        headers=_JSON_HEADERS,
         payload=payload,
     )
+    if labels and not (isinstance(response, dict) and response.get("successful") is False):
+        # New labels become available globally, refresh them on the next get_labels()
+        get_labels.cache_clear()
+    return response
+
 
+def bulk_create_issues(issues: list[dict], concurrency: int = 5) -> list:
+    """
+    Create several Jira issues concurrently instead of one by one.
+    :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issues/#api-rest-api-3-issue-post
 
-def get_issue(issue_key: str, query_params: Optional[dict] = None) -> dict:
+    :param issues: List of dictionaries, each holding the arguments of one create_issue() call:
+                   'project_key', 'title', 'description', 'issuetype' and optionally 'duedate',
+                   'assignee_id', 'labels', 'priority_id' and 'reporter_id'.
+    :param concurrency: Maximum number of issues created in Jira at the same time.
+
+    :return: A list with the JSON-decoded response of each creation, or a dictionary containing the
+             status code, response text, and reason if it failed (including when its arguments
+             are invalid), in the same order as the issues.
+    """
+    logger.info("Creating %s issues, %s at a time", len(issues), concurrency)
+    return map_concurrently(lambda issue: create_issue(**issue), issues, max_workers=max(1, concurrency))
+
+
+def get_issue(
+    issue_key: str,
+    fields: Optional[list[str]] = None,
+    expand: Optional[list[str]] = None,
+    query_params: Optional[dict] = None,
+) -> dict:
     """
     Retrieve a Jira issue by its key, optionally including additional query parameters.
     :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issues/#api-rest-api-3-issue-issueidorkey-get
 
     :param issue_key: The key of the Jira issue to retrieve.
+    :param fields: Optional list of the fields to return (e.g., ["summary", "status"]). Prefer
+                   requesting only the needed fields, otherwise every field of the issue,
+                   including all custom fields, is returned.
+    :param expand: Optional list of additional information to include (e.g., ["changelog"]).
     :param query_params: Optional dictionary of query parameters to include in the request.
 
     :return: The JSON-decoded response from the Jira API if the request is successful,
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Getting issue %s", issue_key)
+    if fields or expand:
+        query_params = {
+            **(query_params or {}),
+            **({"fields": ",".join(fields)} if fields else {}),
+            **({"expand": ",".join(expand)} if expand else {}),
+        }
+
     return jira_api_request(
         method=HTTPMethod.GET,
         endpoint=f"issue/{issue_key}",
@@ -150,28 +232,111 @@ def edit_issue(
     """
     logger.debug("Editing issue %s: setting %s with action '%s'", issue_key, value_key, action)
     logger.debug("Value to update: %s", value_to_update)
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
+    return edit_issue_multi(
+        issue_key=issue_key,
+        updates={value_key: [{action: value_to_update}] if action else value_to_update},
+    )
 
-    payload = {
-        "update": {
-            value_key: (
-                [
-                    {
-                        action: value_to_update,
-                    }
-                ]
-                if action
-                else value_to_update
-            )
-        }
-    }
 
-    return jira_api_request(
+def edit_issue_multi(issue_key: str, updates: dict[str, object]) -> dict:
+    """
+    Edit several fields of a Jira issue in a single request.
+    :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issues/#api-rest-api-3-issue-issueidorkey-put
+
+    :param issue_key: Key of the Jira issue to update.
+    :param updates: Operations to apply, by field key
+                    (e.g., {"summary": [{"set": "New title"}], "labels": [{"add": "foo"}, {"remove": "bar"}]}).
+
+    :return: The JSON-decoded response from the Jira API if the request is successful,
+             otherwise a dictionary containing the status code, response text, and reason.
+    """
+    logger.debug("Editing issue %s: updating %s", issue_key, ", ".join(updates))
+    response = jira_api_request(
         method=HTTPMethod.PUT,
         endpoint=f"issue/{issue_key}",
-        headers=headers,
-        payload=payload,
+        headers=_JSON_HEADERS,
+        payload={"update": updates},
     )
+    if "labels" in updates and not (isinstance(response, dict) and response.get("successful") is False):
+        # New labels become available globally, refresh them on the next get_labels()
+        get_labels.cache_clear()
+    return response
+
+
+# Fields that are replaced with a single "set" operation, mapped to the function converting
+# the given value to what Jira expects (None when the value is sent as is).
+_FIELD_SET_SPEC: dict[str, Optional[Callable[[object], object]]] = {
+    "summary": None,
+    "description": _adf_text,
+    "environment": _adf_text,
+    "reporter": None,
+    "priority": None,
+    "duedate": None,
+}
+
+
+def set_issue_field(issue_key: str, field: str, value: object) -> dict:
+    """
+    Replace the value of a single field of a Jira issue.
+    :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issues/#api-rest-api-3-issue-issueidorkey-put
+
+    :param issue_key: Key of the Jira issue to update.
+    :param field: Field to replace, one of the keys of ``_FIELD_SET_SPEC``.
+    :param value: New value of the field. Plain text for 'description' and 'environment'.
+
+    :return: The JSON-decoded response from the Jira API if the request is successful,
+             otherwise a dictionary containing the status code, response text, and reason.
+    """
+    return update_issue(issue_key, {field: value})
+
+
+def update_issue(issue_key: str, fields: dict[str, object]) -> dict:
+    """
+    Replace the values of several fields of a Jira issue at once, in a single request.
+    Prefer it over several change_issue_* calls when more than one field of an issue changes.
+    :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issues/#api-rest-api-3-issue-issueidorkey-put
+
+    :param issue_key: Key of the Jira issue to update.
+    :param fields: New values by field: 'summary', 'description', 'environment', 'reporter',
+                   'priority' or 'duedate' (e.g., {"summary": "New title", "priority": {"id": "2"}}).
+                   Plain text for 'description' and 'environment'.
+
+    :return: The JSON-decoded response from the Jira API if the request is successful,
+             otherwise a dictionary containing the status code, response text, and reason.
+    """
+    unsupported = [field for field in fields if field not in _FIELD_SET_SPEC]
+    if unsupported:
+        logger.warning("Fields %s cannot be set on issue %s", unsupported, issue_key)
+        return {
+            "successful": False,
+            "status_code": 400,
+            "text": f"Not supported field '{', '.join(unsupported)}'.",
+            "reason": f"Supported fields are: {', '.join(_FIELD_SET_SPEC)}.",
+        }
+
+    logger.info("Updating fields %s of issue %s", ", ".join(fields), issue_key)
+    updates = {}
+    for field, value in fields.items():
+        wrap = _FIELD_SET_SPEC[field]
+        updates[field] = [{"set": wrap(value) if wrap else value}]
+    return edit_issue_multi(issue_key, updates)
+
+
+def bulk_edit_issues(edits: list[dict], concurrency: int = 5) -> list:
+    """
+    Apply several field edits, possibly to different issues, concurrently instead of one by one.
+    :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issues/#api-rest-api-3-issue-issueidorkey-put
+
+    :param edits: List of dictionaries, each holding the arguments of one edit: 'issue_key',
+                  'value_key', 'value_to_update' and optionally 'action' (e.g. 'set', 'add', 'remove').
+    :param concurrency: Maximum number of edits sent to Jira at the same time.
+
+    :return: A list with the JSON-decoded response of each edit, or a dictionary containing the
+             status code, response text, and reason if it failed (including when its arguments
+             are invalid), in the same order as the edits.
+    """
+    logger.info("Editing %s issue fields, %s at a time", len(edits), concurrency)
+    return map_concurrently(lambda edit: edit_issue(**edit), edits, max_workers=max(1, concurrency))
 
 
 def change_issue_title(issue_key: str, new_title: str) -> dict:
@@ -186,12 +351,7 @@ def change_issue_title(issue_key: str, new_title: str) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Changing title of issue %s to '%s'", issue_key, new_title)
-    return edit_issue(
-        issue_key=issue_key,
-        value_key="summary",
-        value_to_update=new_title,
-        action="set",
-    )
+    return set_issue_field(issue_key, "summary", new_title)
 
 
 def change_issue_description(issue_key: str, new_description: str) -> dict:
@@ -206,28 +366,7 @@ def change_issue_description(issue_key: str, new_description: str) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Changing description of issue %s", issue_key)
-    payload = {
-        "content": [
-            {
-                "content": [
-                    {
-                        "text": new_description,
-                        "type": "text",
-                    }
-                ],
-                "type": "paragraph",
-            }
-        ],
-        "type": "doc",
-        "version": 1,
-    }
-
-    return edit_issue(
-        issue_key=issue_key,
-        value_key="description",
-        value_to_update=payload,
-        action="set",
-    )
+    return set_issue_field(issue_key, "description", new_description)
 
 
 def change_issue_reporter(issue_key: str, user: dict) -> dict:
@@ -243,12 +382,7 @@ def change_issue_reporter(issue_key: str, user: dict) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Changing reporter of issue %s to %s", issue_key, user['displayName'])
-    return edit_issue(
-        issue_key=issue_key,
-        value_key="reporter",
-        value_to_update=user,
-        action="set",
-    )
+    return set_issue_field(issue_key, "reporter", user)
 
 
 def change_issue_priority(issue_key: str, new_priority: dict) -> dict:
@@ -259,26 +393,26 @@ def change_issue_priority(issue_key: str, new_priority: dict) -> dict:
     :param issue_key: Key of the Jira issue to update.
     :param new_priority: Dictionary (as returned by get_priorities()) containing the new priority
                          information. Always get the available priorities from get_priorities().
+                         Only its "id" is validated, and the matching usable priority is sent.
 
     :return: The JSON-decoded response from the Jira API if the request is successful,
              otherwise a dictionary containing the status code, response text, and reason.
     """
-    logger.info("Changing priority of issue %s to %s", issue_key, new_priority['name'])
-    if new_priority not in get_priorities():
-        logger.warning("Priority %s not in allowed priorities", new_priority['name'])
+    logger.info("Changing priority of issue %s to %s", issue_key, new_priority.get('name'))
+    priorities = get_priorities_by_id()
+    if isinstance(priorities, dict):
+        return priorities
+    priority = priorities.get(new_priority.get("id"))
+    if priority is None:
+        logger.warning("Priority %s not in allowed priorities", new_priority.get('id'))
         return {
             "successful": False,
             "status_code": 406,
             "text": "Not supported priority. Use get_priorities() to get the allowed priorities.",
-            "reason": "Priority was checked against get_priorities() and it was not part of them.",
+            "reason": "Priority ID was checked against get_priorities() and it was not part of them.",
         }
 
-    return edit_issue(
-        issue_key=issue_key,
-        value_key="priority",
-        value_to_update=new_priority,
-        action="set",
-    )
+    return set_issue_field(issue_key, "priority", priority)
 
 
 def change_issue_environment(issue_key: str, new_environment: str) -> dict:
@@ -293,28 +427,7 @@ def change_issue_environment(issue_key: str, new_environment: str) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Changing environment of issue %s", issue_key)
-    payload = {
-        "content": [
-            {
-                "content": [
-                    {
-                        "text": new_environment,
-                        "type": "text",
-                    }
-                ],
-                "type": "paragraph",
-            }
-        ],
-        "type": "doc",
-        "version": 1,
-    }
-
-    return edit_issue(
-        issue_key=issue_key,
-        value_key="environment",
-        value_to_update=payload,
-        action="set",
-    )
+    return set_issue_field(issue_key, "environment", new_environment)
 
 
 def add_issue_labels(issue_key: str, new_labels: list[str]) -> dict:
@@ -329,12 +442,7 @@ def add_issue_labels(issue_key: str, new_labels: list[str]) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Adding labels %s to issue %s", new_labels, issue_key)
-    labels = [{"add": label} for label in new_labels]
-    return edit_issue(
-        issue_key=issue_key,
-        value_key="labels",
-        value_to_update=labels,
-    )
+    return update_issue_labels(issue_key=issue_key, add=new_labels)
 
 
 def change_issue_labels(issue_key: str, new_labels: list[str]) -> dict:
@@ -349,12 +457,7 @@ def change_issue_labels(issue_key: str, new_labels: list[str]) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Changing labels of issue %s to %s", issue_key, new_labels)
-    return edit_issue(
-        issue_key=issue_key,
-        value_key="labels",
-        value_to_update=new_labels,
-        action="set",
-    )
+    return update_issue_labels(issue_key=issue_key, replace=new_labels)
 
 
 def remove_issue_labels(issue_key: str, labels: list[str]) -> dict:
@@ -369,11 +472,50 @@ def remove_issue_labels(issue_key: str, labels: list[str]) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Removing labels %s from issue %s", labels, issue_key)
-    labels = [{"remove": label} for label in labels]
+    return update_issue_labels(issue_key=issue_key, remove=labels)
+
+
+def update_issue_labels(
+    issue_key: str,
+    add: Optional[list[str]] = None,
+    remove: Optional[list[str]] = None,
+    replace: Optional[list[str]] = None,
+) -> dict:
+    """
+    Add, remove and/or replace labels of a Jira issue in a single request, e.g. to rename a label.
+    :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issues/#api-rest-api-3-issue-issueidorkey-put
+
+    :param issue_key: Key of the Jira issue to update.
+    :param add: List of labels to add to the issue (optional).
+    :param remove: List of labels to remove from the issue (optional).
+    :param replace: List of labels replacing all current labels of the issue (optional).
+                    An empty list removes all labels. If given, labels in add and remove
+                    are applied on top of it.
+
+    :return: The JSON-decoded response from the Jira API if the request is successful,
+             otherwise a dictionary containing the status code, response text, and reason.
+    """
+    logger.info("Updating labels of issue %s: adding %s, removing %s, replacing with %s", issue_key, add, remove, replace)
+    if replace is not None:
+        removed = set(remove or [])
+        labels = [label for label in dict.fromkeys([*replace, *(add or [])]) if label not in removed]
+        operations = [{"set": labels}]
+    else:
+        operations = [{"add": label} for label in add or []] + [{"remove": label} for label in remove or []]
+
+    if not operations:
+        logger.warning("No labels to add or remove for issue %s", issue_key)
+        return {
+            "successful": False,
+            "status_code": 400,
+            "text": "No labels to update. Provide labels to add, remove or replace.",
+            "reason": "The labels to add and to remove were empty and no replacement was given.",
+        }
+
     return edit_issue(
         issue_key=issue_key,
         value_key="labels",
-        value_to_update=labels,
+        value_to_update=operations,
     )
 
 
@@ -389,12 +531,7 @@ def update_issue_duedate(issue_key: str, new_duedate: str) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Updating due date of issue %s to %s", issue_key, new_duedate)
-    return edit_issue(
-        issue_key=issue_key,
-        value_key="duedate",
-        value_to_update=new_duedate,
-        action="set",
-    )
+    return set_issue_field(issue_key, "duedate", new_duedate)
 
 
 def change_issue_parent(issue_key: str, parent_key: str) -> dict:
@@ -410,8 +547,6 @@ def change_issue_parent(issue_key: str, parent_key: str) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Changing parent of issue %s to %s", issue_key, parent_key)
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
-
     payload = {
         "fields": {
             "parent": {"key": parent_key},
@@ -421,11 +556,12 @@ def change_issue_parent(issue_key: str, parent_key: str) -> dict:
     return jira_api_request(
         method=HTTPMethod.PUT,
         endpoint=f"issue/{issue_key}",
-        headers=headers,
+        headers=_JSON_HEADERS,
         payload=payload,
     )
 
 
+@ttl_cache(seconds=METADATA_CACHE_TTL, persistent=True)
 def get_issue_link_types() -> dict:
     """
     Retrieve all available issue link types from Jira.
@@ -441,6 +577,21 @@ def get_issue_link_types() -> dict:
     )
 
 
+@ttl_cache(seconds=METADATA_CACHE_TTL)
+def get_issue_link_type_names() -> frozenset[str] | dict:
+    """
+    Return the names of all available issue link types, cached for ``JIRA_METADATA_CACHE_TTL``
+    seconds since link types rarely change.
+
+    :return: A frozenset with the names of the issue link types if the request is successful,
+             otherwise a dictionary containing the status code, response text, and reason.
+    """
+    link_types = get_issue_link_types()
+    if "issueLinkTypes" not in link_types:
+        return link_types
+    return frozenset(link_type["name"] for link_type in link_types["issueLinkTypes"])
+
+
 def link_issues(
     link_type: str,
     action_issue: str,
@@ -463,7 +614,17 @@ def link_issues(
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Linking issue %s and %s with link type %s", action_issue, receiver_issue, link_type)
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
+    link_type_names = get_issue_link_type_names()
+    if isinstance(link_type_names, dict):
+        return link_type_names
+    if link_type not in link_type_names:
+        logger.warning("Link type %s not in available link types", link_type)
+        return {
+            "successful": False,
+            "status_code": 406,
+            "text": "Not supported link type. Use get_issue_link_types() to get the available link types.",
+            "reason": "Link type was checked against get_issue_link_types() and it was not part of them.",
+        }
 
     payload = {
         "inwardIssue": {
@@ -478,37 +639,21 @@ def link_issues(
     }
 
     if comment_on_action_issue:
-        logger.info("Adding comment to action issue %s", action_issue)
-        comment_field = {
-            "body": {
-                "content": [
-                    {
-                        "content": [
-                            {
-                                "text": comment_on_action_issue,
-                                "type": "text"
-                            }
-                        ],
-                        "type": "paragraph"
-                    }
-                ],
-                "type": "doc",
-                "version": 1
-            },
-        }
+        logger.debug("Adding comment to action issue %s", action_issue)
+        payload.update({"comment": {"body": _adf_text(comment_on_action_issue)}})
 
-        payload.update({"comment": comment_field})
-
-    if comment_on_receiver_issue:
-        logger.info("Adding comment to receiver issue %s", receiver_issue)
-        response = comment_issue(issue_key=receiver_issue, comment=comment_on_receiver_issue)
-
-    return jira_api_request(
+    link_request = partial(
+        jira_api_request,
         method=HTTPMethod.POST,
         endpoint="issueLink",
-        headers=headers,
+        headers=_JSON_HEADERS,
         payload=payload,
     )
+    if not comment_on_receiver_issue:
+        return link_request()
+
+    logger.debug("Adding comment to receiver issue %s", receiver_issue)
+    return _with_comment(link_request, issue_key=receiver_issue, comment=comment_on_receiver_issue)
 
 
 def delete_issues_link(link_id: str) -> dict:
@@ -517,7 +662,7 @@ def delete_issues_link(link_id: str) -> dict:
     :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-link-types/#api-rest-api-3-issuelinktype-issuelinktypeid-delete
 
     :param link_id: The ID of the issue-link to delete. Issue-links of an issue can be obtained 
-                    using get_issue(issue_key, query_params={"fields": "issuelinks"}).
+                    using get_issue(issue_key, fields=["issuelinks"]).
 
     :return: The JSON-decoded response from the Jira API if the request is successful,
              otherwise a dictionary containing the status code, response text, and reason.
@@ -558,12 +703,10 @@ def assign_issue(issue_key: str, user: dict) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Assigning issue %s to %s", issue_key, user['displayName'])
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
-
     return jira_api_request(
         method=HTTPMethod.PUT,
         endpoint=f"issue/{issue_key}/assignee",
-        headers=headers,
+        headers=_JSON_HEADERS,
         payload=user,
     )
 
@@ -580,30 +723,12 @@ def comment_issue(issue_key: str, comment: str) -> dict:
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Adding comment to issue %s", issue_key)
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
-
-    payload = {
-        "body": {
-            "content": [
-                {
-                    "content": [
-                        {
-                            "text": comment,
-                            "type": "text"
-                        }
-                    ],
-                    "type": "paragraph"
-                }
-            ],
-            "type": "doc",
-            "version": 1,
-        }
-    }
+    payload = {"body": _adf_text(comment)}
 
     return jira_api_request(
         method=HTTPMethod.POST,
         endpoint=f"issue/{issue_key}/comment",
-        headers=headers,
+        headers=_JSON_HEADERS,
         payload=payload,
     )
 
@@ -639,21 +764,43 @@ def transition_issue(issue_key: str, transition_id: str, comment: Optional[str]
              otherwise a dictionary containing the status code, response text, and reason.
     """
     logger.info("Transitioning issue %s with transition_id %s", issue_key, transition_id)
-    headers = {"Accept": "application/json", "Content-Type": "application/json"}
-    
     payload = {
         "transition": {
             "id": transition_id
         },
     }
 
-    if comment:
-        logger.info("Adding comment to issue %s during transition", issue_key)
-        response = comment_issue(issue_key=issue_key, comment=comment)
-
-    return jira_api_request(
+    transition_request = partial(
+        jira_api_request,
         method=HTTPMethod.POST,
         endpoint=f"issue/{issue_key}/transitions",
-        headers=headers,
+        headers=_JSON_HEADERS,
         payload=payload,
     )
+    if not comment:
+        return transition_request()
+
+    logger.debug("Adding comment to issue %s during transition", issue_key)
+    return _with_comment(transition_request, issue_key=issue_key, comment=comment)
+
+
+def _with_comment(request: Callable[[], dict | list], issue_key: str, comment: str) -> dict | list:
+    """
+    Send a request and add a comment to an issue concurrently, instead of one after the other.
+    A failure to add the comment is logged, the result of the request is returned.
+
+    :param request: Zero-argument callable performing the main request.
+    :param issue_key: Key of the Jira issue to comment on.
+    :param comment: The text of the comment to add.
+
+    :return: The result of the main request.
+    """
+    results = run_concurrently(
+        {
+            "request": request,
+            "comment": partial(comment_issue, issue_key=issue_key, comment=comment),
+        }
+    )
+    if isinstance(results["comment"], dict) and results["comment"].get("successful") is False:
+        logger.warning("Failed to add comment to issue %s: %s", issue_key, results["comment"]["text"])
+    return results["request"]
@@ -1,18 +1,23 @@
 """Functions for interacting with Jira projects via the API."""
 
 import logging
+from contextlib import closing
 from http import HTTPMethod
-from .general import jira_api_request
+from typing import Iterator
+from .cache import CACHE_MAXSIZE, METADATA_CACHE_TTL, USERS_CACHE_TTL, ttl_cache
+from .general import iter_jira_api_items, jira_api_request, jira_api_request_items, paginate
 
 logger = logging.getLogger(__name__)
 
 
-def get_project_users(project_keys: str) -> dict | list:
+@ttl_cache(seconds=USERS_CACHE_TTL, maxsize=CACHE_MAXSIZE)
+def get_project_users(project_keys: str, all_pages: bool = False) -> dict | list:
     """
     Get all users associated with a given Jira project.
     :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-user-search/#api-rest-api-3-user-assignable-multiprojectsearch-get
 
     :param project_key: Key of the Jira project.
+    :param all_pages: If True, retrieve every page of users instead of only the first one.
 
     :return: The JSON-decoded response from the Jira API if the request is successful,
              otherwise a dictionary containing the status code, response text, and reason.
@@ -20,9 +25,14 @@ def get_project_users(project_keys: str) -> dict | list:
     logger.info("Getting users for project %s", project_keys)
     query_params = {"projectKeys": project_keys}
 
-    return jira_api_request(
+    if all_pages:
+        return paginate(endpoint="user/assignable/multiProjectSearch", params=query_params)
+
+    # The response is a bare array of users which can be large, parse it while it downloads
+    return jira_api_request_items(
         method=HTTPMethod.GET,
         endpoint="user/assignable/multiProjectSearch",
+        items_path="item",
         params=query_params,
     )
 
@@ -47,6 +57,35 @@ def get_project_issues(project_key: str) -> dict:
     )
 
 
+def iter_project_issues(project_key: str) -> Iterator[dict]:
+    """
+    Iterate over the issues of a given project, parsing them one at a time while the response
+    is downloaded instead of loading it whole as get_project_issues() does. Issues listed in
+    several sections of the issue picker are only yielded once. The response is closed when
+    the iterator is exhausted or closed.
+    :API Docs: https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-search/#api-rest-api-3-issue-picker-get
+
+    :param project_key: Key of the Jira project
+
+    :return: An iterator over the issues. Raises ``requests.HTTPError`` if the request fails.
+    """
+    logger.info("Streaming issues for project %s", project_key)
+    seen = set()
+    with closing(
+        iter_jira_api_items(
+            method=HTTPMethod.GET,
+            endpoint="issue/picker",
+            items_path="sections.item.issues.item",
+            params={"currentProjectId": project_key},
+        )
+    ) as issues:
+        for issue in issues:
+            if issue.get("key") not in seen:
+                seen.add(issue.get("key"))
+                yield issue
+
+
+@ttl_cache(seconds=METADATA_CACHE_TTL, maxsize=CACHE_MAXSIZE)
 def get_project_issue_types(project_key: str, max_results: int = 50) -> dict:
     """
     Retrieve all issue types available for a specific Jira project.
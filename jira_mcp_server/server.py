@@ -4,48 +4,101 @@ Jira MCP Server module.
 This module provides a FastMCP server for interacting with the Jira API.
 """
 
+import asyncio
+import atexit
+import functools
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import typing
+import uuid
+from typing import Callable
+
 from dotenv import load_dotenv
+
+# Load the environment before importing the tools, which read their
+# configuration once at import time.
+load_dotenv()
+
 from fastmcp import FastMCP
 
 from config.logging import setup_logging
 
-from jira_api_tools.general import (
-    get_projects,
-    get_priorities,
-    get_labels,
-    get_current_user,
-)
-from jira_api_tools.project import (
-    get_project_users,
-    get_project_issues,
-    get_project_issue_types,
-)
-from jira_api_tools.issue import (
-    get_issue_creation_metadata,
-    create_issue,
-    get_issue,
-    change_issue_title,
-    change_issue_description,
-    change_issue_reporter,
-    change_issue_priority,
-    change_issue_environment,
-    change_issue_parent,
-    add_issue_labels,
-    change_issue_labels,
-    remove_issue_labels,
-    update_issue_duedate,
-    get_issue_link_types,
-    link_issues,
-    delete_issues_link,
-    delete_issue,
-    assign_issue,
-    comment_issue,
-    get_available_transitions,
-    transition_issue,
-)
+from jira_api_tools import TOOLS
+from jira_api_tools.general import close_session
 
-load_dotenv()
 setup_logging()
+atexit.register(close_session)
+
+# Tool results whose JSON is larger than this many bytes are written to a file and returned as
+# a resource URI instead, so they only enter the model context if it reads them. 0 disables it.
+_INLINE_LIMIT_BYTES = int(os.getenv("JIRA_INLINE_LIMIT_BYTES", "0"))
+_RESULTS_DIR = tempfile.mkdtemp(prefix="jira_mcp_results_") if _INLINE_LIMIT_BYTES else None
+if _RESULTS_DIR:
+    atexit.register(shutil.rmtree, _RESULTS_DIR, ignore_errors=True)
+
+
+def _summarize(data: object) -> dict:
+    """
+    Describe the shape of a result returned as a resource, to help decide whether to read it.
+
+    :param data: The JSON-decoded result.
+
+    :return: A dictionary with the type of the result and its length or keys.
+    """
+    if isinstance(data, list):
+        return {"type": "list", "length": len(data)}
+    if isinstance(data, dict):
+        return {"type": "object", "keys": list(data)[:20]}
+    return {"type": type(data).__name__}
+
+
+def _offload_if_large(result: object) -> object:
+    """
+    Write a result to the results directory if its JSON exceeds ``JIRA_INLINE_LIMIT_BYTES``.
+
+    :param result: The result of a tool.
+
+    :return: The result itself if it is small enough, otherwise a dictionary with the
+             'resource_uri' to read it from, its 'size' in bytes and a 'summary' of it.
+    """
+    data = json.dumps(result).encode()
+    if len(data) <= _INLINE_LIMIT_BYTES:
+        return result
+
+    name = f"{uuid.uuid4().hex}.json"
+    with open(os.path.join(_RESULTS_DIR, name), "wb") as f:
+        f.write(data)
+    return {
+        "resource_uri": f"resource://jira/results/{name}",
+        "size": len(data),
+        "summary": _summarize(result),
+    }
+
+
+def run_in_thread(tool: Callable) -> Callable:
+    """
+    Wrap a blocking tool into a coroutine running it in a worker thread.
+    FastMCP calls synchronous tools directly on its event loop, so a slow Jira request would
+    otherwise hold every other tool call until it completes.
+    Large results of tools that may return a dictionary are offloaded, see ``JIRA_INLINE_LIMIT_BYTES``.
+
+    :param tool: The synchronous tool function.
+
+    :return: The coroutine function, with the signature and docstring of the tool.
+    """
+    annotation = inspect.signature(tool).return_annotation
+    offload = _INLINE_LIMIT_BYTES > 0 and (annotation is dict or dict in typing.get_args(annotation))
+
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs):
+        result = await asyncio.to_thread(tool, *args, **kwargs)
+        return _offload_if_large(result) if offload else result
+
+    return wrapper
+
 
 mcp = FastMCP(
     name="Jira API - MCP Server",
@@ -57,38 +110,17 @@ mcp = FastMCP(
         You can also use the tools to get information about Jira users.
         You can also use the tools to get information about Jira groups.
     """,
-    tools=[
-        get_projects,
-        get_priorities,
-        get_labels,
-        get_current_user,
-        get_project_users,
-        get_project_issues,
-        get_project_issue_types,
-        get_issue_creation_metadata,
-        create_issue,
-        get_issue,
-        change_issue_title,
-        change_issue_description,
-        change_issue_reporter,
-        change_issue_priority,
-        change_issue_environment,
-        change_issue_parent,
-        add_issue_labels,
-        change_issue_labels,
-        remove_issue_labels,
-        update_issue_duedate,
-        get_issue_link_types,
-        link_issues,
-        delete_issues_link,
-        delete_issue,
-        assign_issue,
-        comment_issue,
-        get_available_transitions,
-        transition_issue,
-    ],
+    tools=[run_in_thread(tool) for tool in TOOLS],
 )
 
 
+if _RESULTS_DIR:
+    @mcp.resource("resource://jira/results/{name}", mime_type="application/json")
+    def read_result(name: str) -> str:
+        """Read a Jira result that a tool returned as a resource URI because it was too large."""
+        with open(os.path.join(_RESULTS_DIR, os.path.basename(name)), encoding="utf-8") as f:
+            return f.read()
+
+
 if __name__ == "__main__":
     mcp.run()
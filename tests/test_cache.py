@@ -0,0 +1,97 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from jira_mcp_server.jira_api_tools import cache
+from jira_mcp_server.jira_api_tools.cache import DiskCache, ttl_cache
+
+
+class TtlCacheKeyTest(unittest.TestCase):
+    def test_positional_keyword_and_default_calls_share_one_entry(self):
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def get_issue_types(project_key: str, max_results: int = 50):
+            calls.append((project_key, max_results))
+            return [project_key, max_results]
+
+        self.assertEqual(get_issue_types(project_key="P"), ["P", 50])
+        self.assertEqual(get_issue_types("P"), ["P", 50])
+        self.assertEqual(get_issue_types("P", 50), ["P", 50])
+        self.assertEqual(get_issue_types("P", max_results=50), ["P", 50])
+        self.assertEqual(calls, [("P", 50)])
+
+        get_issue_types("P", 10)
+        self.assertEqual(calls, [("P", 50), ("P", 10)])
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.sqlite3")
+
+    def test_round_trip_and_expiry(self):
+        disk = DiskCache(self.path)
+        disk.set("key", "func", {"values": [1, 2]})
+
+        age, value = disk.get("key", 60)
+        self.assertEqual(value, {"values": [1, 2]})
+        self.assertLess(age, 60)
+
+        with mock.patch.object(cache.time, "time", return_value=time.time() + 120):
+            self.assertIs(disk.get("key", 60)[1], cache._MISSING)
+
+    def test_clear_drops_only_the_function_entries(self):
+        disk = DiskCache(self.path)
+        disk.set("a", "func", 1)
+        disk.set("b", "other", 2)
+        disk.clear("func")
+
+        self.assertIs(disk.get("a", 60)[1], cache._MISSING)
+        self.assertEqual(disk.get("b", 60)[1], 2)
+
+    def test_corrupt_row_is_a_miss(self):
+        disk = DiskCache(self.path)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("INSERT INTO cache VALUES ('key', 'func', ?, '{truncated')", (time.time(),))
+
+        self.assertIs(disk.get("key", 60)[1], cache._MISSING)
+
+    def test_persistent_results_survive_a_restart(self):
+        calls = []
+
+        def make_cached():
+            @ttl_cache(seconds=60, persistent=True)
+            def fetch(project_key):
+                calls.append(project_key)
+                return {"key": project_key}
+
+            return fetch
+
+        with mock.patch.object(cache, "DISK_CACHE", DiskCache(self.path)):
+            self.assertEqual(make_cached()("P"), {"key": "P"})
+        # A new process: empty in-memory cache, same file on disk
+        with mock.patch.object(cache, "DISK_CACHE", DiskCache(self.path)):
+            self.assertEqual(make_cached()("P"), {"key": "P"})
+
+        self.assertEqual(calls, ["P"])
+
+    def test_unusable_path_disables_the_disk_cache(self):
+        with open(self.path, "w") as corrupt:
+            corrupt.write("not a database")
+        for path in (os.path.join(self.path + ".missing", "cache.sqlite3"), self.path):
+            with mock.patch.dict(os.environ, {"JIRA_DISK_CACHE": "1", "JIRA_DISK_CACHE_PATH": path}):
+                self.assertIsNone(cache._open_disk_cache())
+
+    def test_disabled_by_default(self):
+        with mock.patch.dict(os.environ, {"JIRA_DISK_CACHE_PATH": self.path}):
+            os.environ.pop("JIRA_DISK_CACHE", None)
+            self.assertIsNone(cache._open_disk_cache())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+
+from jira_mcp_server.jira_api_tools import general, issue
+
+
+class MapConcurrentlyTest(unittest.TestCase):
+    def test_failed_call_gets_an_error_in_its_slot(self):
+        def func(item):
+            if item == 2:
+                raise ValueError("bad item")
+            return item * 10
+
+        results = general.map_concurrently(func, [1, 2, 3])
+
+        self.assertEqual(results[0], 10)
+        self.assertEqual(results[2], 30)
+        self.assertIs(results[1]["successful"], False)
+        self.assertEqual(results[1]["reason"], "ValueError")
+        self.assertEqual(results[1]["text"], "bad item")
+
+
+class BulkEditIssuesTest(unittest.TestCase):
+    def test_invalid_edit_does_not_lose_applied_edits(self):
+        with mock.patch.object(issue, "jira_api_request", return_value={"ok": True}) as request:
+            results = issue.bulk_edit_issues(
+                [
+                    {"issue_key": "A-1", "value_key": "summary", "value_to_update": "x", "action": "set"},
+                    {"issue_key": "A-2", "field": "summary", "value_to_update": "y"},
+                    {"issue_key": "A-3", "value_key": "labels", "value_to_update": "z", "action": "add"},
+                ]
+            )
+
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(results[0], {"ok": True})
+        self.assertEqual(results[2], {"ok": True})
+        self.assertIs(results[1]["successful"], False)
+        self.assertEqual(results[1]["reason"], "TypeError")
+
+
+class BulkCreateIssuesTest(unittest.TestCase):
+    def test_invalid_issue_does_not_lose_created_issues(self):
+        with mock.patch.object(issue, "jira_api_request", return_value={"key": "A-1"}) as request:
+            results = issue.bulk_create_issues(
+                [
+                    {"project_key": "A", "title": "t", "description": "d", "issuetype": "10001"},
+                    {"project_key": "A", "summary": "t", "description": "d", "issuetype": "10001"},
+                ]
+            )
+
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(results[0], {"key": "A-1"})
+        self.assertIs(results[1]["successful"], False)
+        self.assertEqual(results[1]["reason"], "TypeError")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+from jira_mcp_server.jira_api_tools import issue
+
+_FAILED = {"successful": False, "status_code": 400, "text": "bad", "reason": "Bad Request"}
+
+
+class LabelsCacheInvalidationTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(issue.get_labels, "cache_clear")
+        self.cache_clear = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_successful_label_edit_clears_the_cache(self):
+        with mock.patch.object(issue, "jira_api_request", return_value={}):
+            issue.add_issue_labels("P-1", ["new"])
+
+        self.cache_clear.assert_called_once()
+
+    def test_failed_label_edit_keeps_the_cache(self):
+        with mock.patch.object(issue, "jira_api_request", return_value=_FAILED):
+            issue.add_issue_labels("P-1", ["new"])
+
+        self.cache_clear.assert_not_called()
+
+    def test_generic_edits_of_labels_clear_the_cache(self):
+        with mock.patch.object(issue, "jira_api_request", return_value={}):
+            issue.bulk_edit_issues([{"issue_key": "P-1", "value_key": "labels", "value_to_update": "x", "action": "add"}])
+            issue.edit_issue_multi("P-2", {"labels": [{"remove": "y"}]})
+
+        self.assertEqual(self.cache_clear.call_count, 2)
+
+    def test_edits_of_other_fields_keep_the_cache(self):
+        with mock.patch.object(issue, "jira_api_request", return_value={}):
+            issue.update_issue("P-1", {"summary": "New title"})
+
+        self.cache_clear.assert_not_called()
+
+    def test_failed_creation_with_labels_keeps_the_cache(self):
+        with mock.patch.object(issue, "jira_api_request", return_value=_FAILED):
+            issue.create_issue("P", "t", "d", "10001", labels=["new"])
+
+        self.cache_clear.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
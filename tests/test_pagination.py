@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+
+from jira_mcp_server.jira_api_tools import general
+
+
+def _pages(*pages):
+    return mock.patch.object(general, "jira_api_request", side_effect=list(pages))
+
+
+class PaginateTest(unittest.TestCase):
+    def test_total_pages_without_is_last_are_all_fetched(self):
+        with _pages(
+            {"startAt": 0, "maxResults": 2, "total": 5, "values": [1, 2]},
+            {"startAt": 2, "maxResults": 2, "total": 5, "values": [3, 4]},
+            {"startAt": 4, "maxResults": 2, "total": 5, "values": [5]},
+        ) as request:
+            items = general.paginate("project/search", page_size=2)
+
+        self.assertEqual(items, [1, 2, 3, 4, 5])
+        self.assertEqual(request.call_count, 3)
+
+    def test_is_last_stops(self):
+        with _pages({"isLast": True, "values": [1, 2]}) as request:
+            items = general.paginate("project/search", page_size=2)
+
+        self.assertEqual(items, [1, 2])
+        self.assertEqual(request.call_count, 1)
+
+    def test_page_without_markers_continues_until_empty(self):
+        with _pages({"values": [1, 2]}, {"values": []}) as request:
+            items = general.paginate("project/search", page_size=2)
+
+        self.assertEqual(items, [1, 2])
+        self.assertEqual(request.call_count, 2)
+
+    def test_list_endpoint_ignoring_start_at_stops(self):
+        with _pages([1, 2], [1, 2]) as request:
+            items = general.paginate("users", page_size=2)
+
+        self.assertEqual(items, [1, 2])
+        self.assertEqual(request.call_count, 2)
+
+    def test_items_are_trimmed_to_max_results(self):
+        with _pages({"startAt": 0, "total": 5, "values": [1, 2, 3, 4, 5]}):
+            items = general.paginate("project/search", max_results=3)
+
+        self.assertEqual(items, [1, 2, 3])
+
+    def test_page_count_is_capped(self):
+        pages = mock.Mock(side_effect=lambda **kwargs: [kwargs["params"]["startAt"]])
+        with mock.patch.object(general, "jira_api_request", pages), mock.patch.object(general, "_MAX_PAGES", 3):
+            items = general.paginate("users", page_size=1)
+
+        self.assertEqual(items, [0, 1, 2])
+        self.assertEqual(pages.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
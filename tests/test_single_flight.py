@@ -0,0 +1,79 @@
+import json
+import threading
+import time
+import unittest
+from http import HTTPMethod
+from unittest import mock
+
+import requests
+
+from jira_mcp_server.jira_api_tools import general
+
+
+def _response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response._content = json.dumps(body).encode()
+    return response
+
+
+class FakeSession:
+    """Session whose GET requests block until ``release`` is set."""
+
+    def __init__(self):
+        self.gets = 0
+        self.sent = threading.Event()
+        self.release = threading.Event()
+
+    def request(self, method, url, **kwargs):
+        if method != HTTPMethod.GET:
+            return _response({})
+        self.gets += 1
+        self.sent.set()
+        self.release.wait(5)
+        return _response({"values": [self.gets]})
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.session = FakeSession()
+        patcher = mock.patch.object(general, "_SESSION", self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_in_thread(self, results):
+        thread = threading.Thread(target=lambda: results.append(general.jira_api_request(HTTPMethod.GET, "priority")))
+        thread.start()
+        return thread
+
+    def test_identical_get_joins_the_one_in_flight(self):
+        results = []
+        first = self._get_in_thread(results)
+        self.session.sent.wait(5)
+        second = self._get_in_thread(results)
+        time.sleep(0.2)
+        self.session.release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(self.session.gets, 1)
+        self.assertEqual(results[0], results[1])
+        self.assertIsNot(results[0], results[1])
+
+    def test_get_after_a_write_does_not_join(self):
+        results = []
+        first = self._get_in_thread(results)
+        self.session.sent.wait(5)
+        general.jira_api_request(HTTPMethod.PUT, "issue/P-1", payload={"update": {}})
+        second = self._get_in_thread(results)
+        time.sleep(0.2)
+        self.session.release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(self.session.gets, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import io
+import itertools
+import json
+import unittest
+from unittest import mock
+
+import requests
+
+from jira_mcp_server.jira_api_tools import general, project
+
+
+class FakeStreamedResponse:
+    def __init__(self, document):
+        self.content = json.dumps(document).encode()
+        self.raw = io.BytesIO(self.content)
+        self.closed = False
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class IterJiraApiItemsTest(unittest.TestCase):
+    def test_stopping_early_closes_the_response(self):
+        response = FakeStreamedResponse({"values": [{"id": i} for i in range(100)]})
+        with mock.patch.object(general, "_stream_request", return_value=response):
+            items = general.iter_jira_api_items("GET", "project/search", "values.item")
+            first = list(itertools.islice(items, 3))
+            self.assertFalse(response.closed)
+            items.close()
+
+        self.assertEqual(first, [{"id": 0}, {"id": 1}, {"id": 2}])
+        self.assertTrue(response.closed)
+
+    def test_exhausting_closes_the_response(self):
+        response = FakeStreamedResponse({"values": [{"id": 1}, {"id": 2}]})
+        with mock.patch.object(general, "_stream_request", return_value=response):
+            self.assertEqual(list(general.iter_jira_api_items("GET", "x", "values.item")), [{"id": 1}, {"id": 2}])
+
+        self.assertTrue(response.closed)
+
+    def test_failed_request_raises(self):
+        summary = {"successful": False, "status_code": 404, "text": "missing", "reason": "Not Found", "truncated": False}
+        with mock.patch.object(general, "_stream_request", return_value=summary):
+            with self.assertRaises(requests.HTTPError):
+                next(general.iter_jira_api_items("GET", "x", "values.item"))
+
+
+class UndecodableBodyTest(unittest.TestCase):
+    def test_items_and_plain_requests_agree_on_a_non_json_success(self):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response._content = b"<html>not json</html>"
+        response.raw = io.BytesIO(response._content)
+        session = mock.Mock()
+        session.request.return_value = response
+
+        with mock.patch.object(general, "_stream_request", return_value=response):
+            items = general.jira_api_request_items("GET", "x", "values.item")
+        with mock.patch.object(general, "_SESSION", session):
+            plain = general.jira_api_request("POST", "x")
+
+        self.assertIs(items["successful"], True)
+        self.assertIs(plain["successful"], True)
+        self.assertEqual(items["status_code"], plain["status_code"])
+        self.assertEqual(set(items), set(plain))
+
+
+class IterProjectIssuesTest(unittest.TestCase):
+    def test_issues_are_deduplicated_and_response_closed_early(self):
+        response = FakeStreamedResponse(
+            {
+                "sections": [
+                    {"issues": [{"key": "P-1"}, {"key": "P-2"}]},
+                    {"issues": [{"key": "P-1"}, {"key": "P-3"}, {"key": "P-4"}]},
+                ]
+            }
+        )
+        with mock.patch.object(general, "_stream_request", return_value=response):
+            issues = project.iter_project_issues("P")
+            first = list(itertools.islice(issues, 3))
+            issues.close()
+
+        self.assertEqual(first, [{"key": "P-1"}, {"key": "P-2"}, {"key": "P-3"}])
+        self.assertTrue(response.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()